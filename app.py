@@ -1,10 +1,76 @@
 from flask import Flask, render_template, jsonify
+import calendar
 import docker
+import os
+import requests
+import threading
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial, wraps
 
 app = Flask(__name__)
 
+# Upper bound on concurrent dockerd calls.
+# docker-py keeps at most 10 pooled connections to the socket.
+MAX_STATS_WORKERS = 10
+
+# Shared pool for dockerd calls, reused by every snapshot instead of spinning
+# up fresh threads each time.
+_executor = ThreadPoolExecutor(max_workers=MAX_STATS_WORKERS, thread_name_prefix='dockerd')
+
+# Previous CPU sample per container: id -> (timestamp, total_usage, system_usage).
+# Kept across requests so CPU% needs one stats call instead of two.
+_prev_stats = {}
+_prev_stats_lock = threading.Lock()
+
+# How long a dockerd snapshot is served before it is fetched again.
+# Concurrent viewers and auto-refreshes inside this window share one fetch.
+CACHE_TTL = 5
+
+# How often the page polls /api/state, in seconds
+REFRESH_INTERVAL = 30
+
+# Latest streamed stats sample per running container, written by the
+# background stream threads. _streams maps container id -> stream token.
+_latest_stats = {}
+_streams = {}
+_latest_stats_lock = threading.Lock()
+_collectors_started = False
+
+# Shared Docker client — see get_docker_client
+_client = None
+_client_lock = threading.Lock()
+
+# When the daemon last answered a ping (time.monotonic()). /health trusts a
+# ping younger than HEALTH_PING_INTERVAL instead of pinging again.
+_last_ping_ok = 0.0
+HEALTH_PING_INTERVAL = 1.0
+
+# Page cache key in a stats sample's memory_stats.stats: 'cache' on cgroup v1,
+# 'file' on cgroup v2. Same for every container, so detected from the first sample.
+_MEM_CACHE_KEY = None
+
+# Host CPU count, read from the daemon when the client connects
+_NUM_CPUS = os.cpu_count() or 1
+
+# Host cgroup filesystem, mounted read-only by docker-compose.yml.
+# Mounted beside (not over) the container's own /sys/fs/cgroup.
+CGROUP_ROOT = os.environ.get('CGROUP_ROOT', '/host/sys/fs/cgroup')
+
+# Previous cgroup CPU reading per container: id -> (None, usage_ns, monotonic_ns)
+_prev_cgroup_cpu = {}
+
+# StartedAt per running container. The container list doesn't include it, so
+# each container is inspected once; the events watcher evicts entries when a
+# container starts or dies.
+_started_at = {}
+_started_at_lock = threading.Lock()
+
+# Bumped by the events watcher on every eviction, so an inspect that raced
+# with a restart doesn't write the old StartedAt back — see _get_started_at
+_started_at_generation = 0
+
 
 # ─── Docker Client ────────────────────────────────────────────────────────────
 
@@ -13,88 +79,348 @@ def get_docker_client():
     Connect to the Docker daemon via the mounted socket.
     /var/run/docker.sock is mounted from the host into this container.
     This gives us the same access as running docker commands on zeus01 directly.
+
+    The client is created once and reused by every request, so its connection
+    pool stays warm and we only ping the daemon when (re)connecting. Callers
+    that see the daemon go away call reset_docker_client() to reconnect.
     """
-    try:
-        client = docker.from_env()
-        client.ping()  # verify daemon is reachable
-        return client, None
-    except docker.errors.DockerException as e:
-        return None, str(e)
+    global _client, _NUM_CPUS, _last_ping_ok
+    with _client_lock:
+        if _client is None:
+            try:
+                client = docker.from_env()
+                client.ping()  # verify daemon is reachable
+                _last_ping_ok = time.monotonic()
+                # The host's CPU count doesn't change — read it once, not per sample
+                _NUM_CPUS = client.info().get('NCPU') or os.cpu_count() or 1
+            except (docker.errors.DockerException, requests.exceptions.ConnectionError) as e:
+                return None, str(e)
+            _client = client
+        return _client, None
+
+
+def reset_docker_client():
+    """Drop the cached client — the next get_docker_client() reconnects."""
+    global _client, _last_ping_ok
+    with _client_lock:
+        _client = None
+        _last_ping_ok = 0.0
+
+
+def ping_docker(client):
+    """
+    Check the daemon is still reachable, at most once per HEALTH_PING_INTERVAL.
+    Health probes hit this every few seconds — any recent successful dockerd
+    call is good enough, and saves dockerd a round-trip per probe.
+    """
+    if time.monotonic() - _last_ping_ok < HEALTH_PING_INTERVAL:
+        return
+    client.ping()
+    mark_docker_ok()
+
+
+def mark_docker_ok():
+    """Record that dockerd just answered — called after any successful call."""
+    global _last_ping_ok
+    _last_ping_ok = time.monotonic()
+
+
+# ─── Caching ─────────────────────────────────────────────────────────────────
+
+def ttl_cache(seconds):
+    """
+    Cache a function's result for a few seconds.
+    The lock means only one thread refetches when the entry expires — the
+    others wait for it and get the fresh value instead of hitting dockerd too.
+    If the function raises, nothing is cached and the next call tries again.
+    Arguments are not part of the key: there is only one Docker daemon.
+    """
+    def decorator(func):
+        lock = threading.Lock()
+        cached = {'expires': 0.0, 'value': None}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with lock:
+                if time.monotonic() >= cached['expires']:
+                    cached['value'] = func(*args, **kwargs)
+                    cached['expires'] = time.monotonic() + seconds
+                return cached['value']
+        return wrapper
+    return decorator
 
 
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
-def get_cpu_percent(container):
+def get_runtime_stats(client, container_id):
     """
-    CPU percentage requires two stat samples with a delta calculation.
-    The Docker stats API returns cumulative CPU nanoseconds, not a percentage.
-    We take two readings 0.1s apart and calculate the delta.
+    CPU percentage and memory usage for a running container.
+    The Docker stats API returns cumulative CPU nanoseconds, not a percentage,
+    so CPU% is always a delta between two samples.
+
+    Cheapest first: when the host's cgroup filesystem is mounted we read the
+    counters straight from the kernel — the stats API is slow because dockerd
+    does exactly this, twice, with a wait in between.
+
+    If a background stream is running for the container, its latest sample
+    already carries both readings (cpu_stats and precpu_stats) — no I/O at all.
+    Otherwise we make a single one-shot stats call (no waiting inside dockerd,
+    no sleep here) and take the delta against the sample kept from the
+    previous request — 5-30s old, which is plenty for a dashboard. The first
+    time we see a container there is nothing to diff against, so CPU% is None
+    for one refresh rather than blocking the page for a second sample.
 
     Interview answer: "Docker reports cumulative CPU usage. To get a percentage
     you calculate the delta between two readings divided by the system CPU delta,
     multiplied by the number of CPUs."
     """
+    if _CGROUP_VERSION is not None:
+        try:
+            return _cgroup_runtime_stats(container_id)
+        except (OSError, ValueError):
+            pass  # no cgroup files for this container — use the stats API
+
+    with _latest_stats_lock:
+        streamed = _latest_stats.get(container_id)
+
+    if streamed is not None:
+        cpu_stats = streamed.get('cpu_stats', {})
+        return {
+            'cpu_percent': _cpu_percent(
+                _cpu_sample(streamed.get('precpu_stats', {})),
+                _cpu_sample(cpu_stats),
+                _NUM_CPUS,
+            ),
+            'memory': _memory_stats(streamed),
+        }
+
+    with _prev_stats_lock:
+        prev = _prev_stats.get(container_id)
+
     try:
-        stats1 = container.stats(stream=False)
-        time.sleep(0.1)
-        stats2 = container.stats(stream=False)
-
-        cpu_delta = (
-            stats2['cpu_stats']['cpu_usage']['total_usage'] -
-            stats1['cpu_stats']['cpu_usage']['total_usage']
-        )
-        system_delta = (
-            stats2['cpu_stats']['system_cpu_usage'] -
-            stats1['cpu_stats']['system_cpu_usage']
-        )
-        num_cpus = stats2['cpu_stats'].get('online_cpus', 1)
-
-        if system_delta > 0:
-            return round((cpu_delta / system_delta) * num_cpus * 100, 2)
-        return 0.0
+        if _supports_one_shot(client):
+            stats = client.api.stats(container_id, stream=False, one_shot=True)
+        else:
+            stats = client.api.stats(container_id, stream=False)
     except Exception:
-        return None
+        return {'cpu_percent': None, 'memory': {'used_mb': 0, 'limit_mb': 0, 'percent': 0}}
+
+    cpu_stats = stats.get('cpu_stats', {})
+    sample = _cpu_sample(cpu_stats, time.time())
+    with _prev_stats_lock:
+        _prev_stats[container_id] = sample
+
+    if prev is None:
+        # Daemons older than API 1.41 already waited to fill in precpu_stats
+        precpu = stats.get('precpu_stats', {})
+        if precpu.get('system_cpu_usage'):
+            prev = _cpu_sample(precpu)
+
+    return {
+        'cpu_percent': _cpu_percent(prev, sample, _NUM_CPUS) if prev is not None else None,
+        'memory': _memory_stats(stats),
+    }
+
+
+def _cpu_sample(cpu_stats, timestamp=None):
+    """(timestamp, total_usage, system_usage) from a cpu_stats block."""
+    return (
+        timestamp,
+        cpu_stats.get('cpu_usage', {}).get('total_usage', 0),
+        cpu_stats.get('system_cpu_usage', 0),
+    )
 
 
-def get_memory_stats(container):
+def _supports_one_shot(client):
+    """The one-shot stats query was added in Docker API 1.41."""
+    return docker.utils.version_gte(client.api.api_version, '1.41')
+
+
+def _cpu_percent(prev, sample, num_cpus):
+    _, prev_total, prev_system = prev
+    _, total, system = sample
+
+    cpu_delta = total - prev_total
+    system_delta = system - prev_system
+
+    # A restarted container resets its counters — skip the bogus negative delta
+    if system_delta > 0 and cpu_delta >= 0:
+        return round((cpu_delta / system_delta) * num_cpus * 100, 2)
+    return 0.0
+
+
+def _forget_stats(container_ids):
+    """Drop previous samples for containers that no longer exist."""
+    with _prev_stats_lock:
+        for samples in (_prev_stats, _prev_cgroup_cpu):
+            for cid in list(samples):
+                if cid not in container_ids:
+                    del samples[cid]
+
+
+def _memory_stats(stats):
     """
-    Memory usage and limit from a single stats call.
+    Memory usage and limit from a stats sample.
     Returns used MB and limit MB.
     """
+    global _MEM_CACHE_KEY
     try:
-        stats = container.stats(stream=False)
         mem_stats = stats.get('memory_stats', {})
         usage = mem_stats.get('usage', 0)
         limit = mem_stats.get('limit', 0)
 
-        # Subtract cache from usage (Linux reports cache as used memory)
-        cache = mem_stats.get('stats', {}).get('cache', 0)
-        actual_usage = max(0, usage - cache)
-
-        return {
-            'used_mb': round(actual_usage / (1024 * 1024), 1),
-            'limit_mb': round(limit / (1024 * 1024), 1),
-            'percent': round((actual_usage / limit * 100), 1) if limit > 0 else 0
-        }
+        # Subtract cache from usage (Linux reports cache as used memory).
+        # cgroup v2 hosts call it 'file' — without this the subtraction
+        # silently does nothing and memory is overstated.
+        detail = mem_stats.get('stats', {})
+        if _MEM_CACHE_KEY is None and detail:
+            _MEM_CACHE_KEY = 'cache' if 'cache' in detail else 'file'
+        cache = detail.get(_MEM_CACHE_KEY, 0)
+        return _memory_summary(usage, cache, limit)
     except Exception:
         return {'used_mb': 0, 'limit_mb': 0, 'percent': 0}
 
 
+def _memory_summary(usage, cache, limit):
+    actual_usage = max(0, usage - cache)
+    return {
+        'used_mb': round(actual_usage / (1024 * 1024), 1),
+        'limit_mb': round(limit / (1024 * 1024), 1),
+        'percent': round((actual_usage / limit * 100), 1) if limit > 0 else 0
+    }
+
+
+# ─── cgroup Files ────────────────────────────────────────────────────────────
+
+def _detect_cgroup_version():
+    """
+    2 for the unified hierarchy, 1 for the legacy per-controller one,
+    None when the host cgroup filesystem isn't mounted (or isn't Linux).
+    """
+    if os.path.exists(os.path.join(CGROUP_ROOT, 'cgroup.controllers')):
+        return 2
+    if os.path.isdir(os.path.join(CGROUP_ROOT, 'cpuacct')):
+        return 1
+    return None
+
+
+_CGROUP_VERSION = _detect_cgroup_version()
+
+
+def _read_cgroup_file(controller, container_id, name):
+    """
+    Read a file from the container's cgroup directory.
+    Docker puts containers under docker-<id>.scope with the systemd cgroup
+    driver and under docker/<id> with the cgroupfs driver — try both.
+    """
+    base = CGROUP_ROOT if _CGROUP_VERSION == 2 else os.path.join(CGROUP_ROOT, controller)
+    for directory in (
+        os.path.join(base, 'system.slice', f'docker-{container_id}.scope'),
+        os.path.join(base, 'docker', container_id),
+    ):
+        try:
+            with open(os.path.join(directory, name)) as f:
+                return f.read()
+        except FileNotFoundError:
+            continue
+    raise FileNotFoundError(f'no {name} cgroup file for {container_id[:12]}')
+
+
+def _parse_flat_keyed(text):
+    """Parse 'key value' lines (cpu.stat, memory.stat) into a dict of ints."""
+    result = {}
+    for line in text.splitlines():
+        key, _, value = line.partition(' ')
+        if value:
+            result[key] = int(value)
+    return result
+
+
+def read_cgroup_cpu(container_id):
+    """Cumulative CPU time used by the container, in nanoseconds."""
+    if _CGROUP_VERSION == 2:
+        cpu_stat = _parse_flat_keyed(_read_cgroup_file('cpu', container_id, 'cpu.stat'))
+        return cpu_stat['usage_usec'] * 1000
+    return int(_read_cgroup_file('cpuacct', container_id, 'cpuacct.usage'))
+
+
+def read_cgroup_memory(container_id):
+    """Memory usage minus page cache, and the limit — same shape as _memory_stats."""
+    if _CGROUP_VERSION == 2:
+        usage = int(_read_cgroup_file('memory', container_id, 'memory.current'))
+        mem_stat = _parse_flat_keyed(_read_cgroup_file('memory', container_id, 'memory.stat'))
+        cache = mem_stat.get('file', 0)
+        limit = _read_cgroup_file('memory', container_id, 'memory.max').strip()
+        limit = _host_memory_bytes() if limit == 'max' else int(limit)
+    else:
+        usage = int(_read_cgroup_file('memory', container_id, 'memory.usage_in_bytes'))
+        mem_stat = _parse_flat_keyed(_read_cgroup_file('memory', container_id, 'memory.stat'))
+        cache = mem_stat.get('cache', 0)
+        # v1 reports "unlimited" as a huge number rather than a keyword
+        limit = min(int(_read_cgroup_file('memory', container_id, 'memory.limit_in_bytes')),
+                    _host_memory_bytes())
+    return _memory_summary(usage, cache, limit)
+
+
+_host_memory = None
+
+
+def _host_memory_bytes():
+    """MemTotal from /proc/meminfo — what Docker reports as the limit for unlimited containers."""
+    global _host_memory
+    if _host_memory is None:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemTotal:'):
+                    _host_memory = int(line.split()[1]) * 1024
+                    break
+            else:
+                _host_memory = 0
+    return _host_memory
+
+
+def _cgroup_runtime_stats(container_id):
+    """
+    CPU% and memory straight from the cgroup files.
+    CPU% is usage time over wall time since the previous request's reading,
+    which is what Docker's cpu_delta / system_delta * num_cpus works out to.
+    There is nothing to diff against on the first reading, so CPU% is None
+    until the next refresh.
+    """
+    sample = (None, read_cgroup_cpu(container_id), time.monotonic_ns())
+    memory = read_cgroup_memory(container_id)
+
+    with _prev_stats_lock:
+        prev = _prev_cgroup_cpu.get(container_id)
+        _prev_cgroup_cpu[container_id] = sample
+
+    return {
+        'cpu_percent': _cpu_percent(prev, sample, 1) if prev is not None else None,
+        'memory': memory,
+    }
+
+
 def format_uptime(started_at_str):
     """
     Convert Docker's started_at timestamp to a human-readable uptime string.
     e.g. "2h 34m" or "3d 12h"
+
+    Docker always writes UTC in a fixed layout (2024-01-15T10:30:45.123456789Z),
+    so we slice the fields out by position instead of running the general ISO
+    parser. Fractional seconds don't matter at minute resolution.
     """
     try:
-        # Docker returns ISO format with timezone
-        started = datetime.fromisoformat(started_at_str.replace('Z', '+00:00'))
-        now = datetime.now(timezone.utc)
-        delta = now - started
-        total_seconds = int(delta.total_seconds())
-
-        days = total_seconds // 86400
-        hours = (total_seconds % 86400) // 3600
-        minutes = (total_seconds % 3600) // 60
+        s = started_at_str
+        started = calendar.timegm((
+            int(s[0:4]), int(s[5:7]), int(s[8:10]),
+            int(s[11:13]), int(s[14:16]), int(s[17:19]),
+            0, 0, 0,
+        ))
+        total_seconds = int(time.time()) - started
+
+        minutes, _ = divmod(total_seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        days, hours = divmod(hours, 24)
 
         if days > 0:
             return f"{days}d {hours}h"
@@ -106,75 +432,147 @@ def format_uptime(started_at_str):
         return 'unknown'
 
 
+def _get_started_at(client, container_id):
+    """StartedAt for a running container — inspected once, then cached."""
+    with _started_at_lock:
+        started_at = _started_at.get(container_id)
+        generation = _started_at_generation
+    if started_at is None:
+        try:
+            started_at = client.api.inspect_container(container_id)['State']['StartedAt']
+        except (docker.errors.DockerException, requests.exceptions.ConnectionError, KeyError):
+            return ''
+        with _started_at_lock:
+            # Something started or died mid-inspect — the answer may already
+            # be stale, so use it for this snapshot but don't cache it
+            if generation == _started_at_generation:
+                _started_at[container_id] = started_at
+    return started_at
+
+
+def _collect_one(client, image_index, container):
+    """
+    Everything the dashboard shows for a single container.
+    `container` is a raw entry from the low-level containers API — reading it
+    costs nothing, unlike the SDK's Container objects.
+    Runs on a worker thread — see get_container_data.
+    """
+    # Get port mappings
+    ports = []
+    port_list = container.get('Ports')
+    if port_list:
+        ports_append = ports.append
+        for port in port_list:
+            host_port = port.get('PublicPort')
+            if host_port:
+                ports_append({
+                    'host': str(host_port),
+                    'container': str(port.get('PrivatePort', ''))
+                })
+
+    # Get image info from the index built by get_container_data
+    image_id = container.get('ImageID', '')
+    image_attrs = image_index.get(image_id)
+    if image_attrs is not None:
+        image_size_mb = round(image_attrs.get('Size', 0) / (1024 * 1024), 1)
+        # Untagged images list '<none>:<none>' — the SDK's Image.tags drops it
+        repo_tags = [tag for tag in image_attrs.get('RepoTags') or [] if tag != '<none>:<none>']
+        if repo_tags:
+            image_name = repo_tags[0]
+        else:
+            # Same as the SDK's Image.short_id
+            image_name = image_id[:17] if image_id.startswith('sha256:') else image_id[:10]
+    else:
+        image_size_mb = 0
+        image_name = 'unknown'
+
+    container_id = container['Id']
+    names = container.get('Names')
+    status = container.get('State', 'unknown')
+    data = {
+        'id': container_id[:12],
+        'name': names[0].lstrip('/') if names else container_id[:12],
+        'status': status,
+        'image': image_name,
+        'image_size_mb': image_size_mb,
+        'ports': ports,
+    }
+
+    if status == 'running':
+        data['uptime'] = format_uptime(_get_started_at(client, container_id))
+        data.update(get_runtime_stats(client, container_id))
+    else:
+        data['uptime'] = '—'
+        data['cpu_percent'] = None
+        data['memory'] = None
+
+    return data
+
+
 def get_container_data(client):
     """
     Collect data for all containers — running and stopped.
-    Returns two lists: running and stopped.
+    Returns two lists: running and stopped. If the daemon can't be listed the
+    error propagates, so the caller reports it instead of caching an empty
+    dashboard.
+
+    The low-level containers call returns every container's name, image,
+    state and ports in one response. The SDK's containers.list() would inspect
+    each container on top of that — one round-trip per container.
+
+    Stats can still cost a round-trip per container, so containers are
+    collected in parallel on the shared pool. The calls are I/O-bound, so
+    threads overlap fine despite the GIL. The pool is capped at
+    MAX_STATS_WORKERS — that matches the Docker SDK's connection pool size and
+    keeps dockerd from spiking when it has to serve a burst of stats requests.
     """
-    running = []
-    stopped = []
+    # One images call for all containers instead of one per container,
+    # overlapped with the containers call
+    images = _executor.submit(client.api.images, all=True)
 
     try:
-        all_containers = client.containers.list(all=True)
-    except docker.errors.DockerException:
+        all_containers = client.api.containers(all=True)
+        mark_docker_ok()
+    except (docker.errors.DockerException, requests.exceptions.ConnectionError):
+        reset_docker_client()
+        raise
+
+    _forget_stats({container['Id'] for container in all_containers})
+    _forget_started_at({
+        container['Id'] for container in all_containers if container.get('State') == 'running'
+    })
+
+    if not all_containers:
         return [], []
 
-    for container in all_containers:
-        # Get port mappings
-        ports = []
-        port_bindings = container.ports or {}
-        for container_port, host_bindings in port_bindings.items():
-            if host_bindings:
-                for binding in host_bindings:
-                    host_port = binding.get('HostPort', '')
-                    if host_port:
-                        ports.append({
-                            'host': host_port,
-                            'container': container_port.replace('/tcp', '').replace('/udp', '')
-                        })
-
-        # Get image info
-        try:
-            image = client.images.get(container.image.id)
-            image_size_mb = round(image.attrs.get('Size', 0) / (1024 * 1024), 1)
-            image_name = container.image.tags[0] if container.image.tags else container.image.short_id
-        except Exception:
-            image_size_mb = 0
-            image_name = 'unknown'
-
-        # Get logs
-        try:
-            logs = container.logs(tail=20).decode('utf-8', errors='replace').strip()
-            log_lines = logs.split('\n') if logs else []
-        except Exception:
-            log_lines = []
-
-        data = {
-            'id': container.short_id,
-            'name': container.name,
-            'status': container.status,
-            'image': image_name,
-            'image_size_mb': image_size_mb,
-            'ports': ports,
-            'log_lines': log_lines,
-        }
+    try:
+        image_index = {image['Id']: image for image in images.result()}
+    except (docker.errors.DockerException, requests.exceptions.ConnectionError):
+        image_index = {}
 
-        if container.status == 'running':
-            attrs = container.attrs.get('State', {})
-            started_at = attrs.get('StartedAt', '')
-            data['uptime'] = format_uptime(started_at)
-            data['cpu_percent'] = get_cpu_percent(container)
-            data['memory'] = get_memory_stats(container)
-            running.append(data)
-        else:
-            data['uptime'] = '—'
-            data['cpu_percent'] = None
-            data['memory'] = None
-            stopped.append(data)
+    results = list(_executor.map(partial(_collect_one, client, image_index), all_containers))
 
+    # One pass over the results, with the appends bound once
+    running = []
+    stopped = []
+    running_append = running.append
+    stopped_append = stopped.append
+    for data in results:
+        if data['status'] == 'running':
+            running_append(data)
+        else:
+            stopped_append(data)
     return running, stopped
 
 
+def _forget_started_at(running_ids):
+    """Drop cached StartedAt for containers that are no longer running."""
+    with _started_at_lock:
+        for cid in list(_started_at):
+            if cid not in running_ids:
+                del _started_at[cid]
+
+
 def get_docker_info(client):
     """
     Host-level Docker info — version, total containers, images.
@@ -215,27 +613,196 @@ def get_network_info(client):
         return []
 
 
+@ttl_cache(CACHE_TTL)
+def get_snapshot(client):
+    """
+    Everything the dashboard shows, plus when it was collected.
+    The timestamp is formatted once per snapshot rather than once per request,
+    so every viewer served from the cache sees when the data actually dates from.
+
+    Host info and networks are fetched on the shared pool while the container
+    data is collected here, so the snapshot takes as long as the slowest of
+    them rather than the sum. get_container_data runs in this thread on
+    purpose: it fans out on the same pool, and waiting on the pool from
+    inside the pool could starve it.
+    """
+    docker_info = _executor.submit(get_docker_info, client)
+    networks = _executor.submit(get_network_info, client)
+    running, stopped = get_container_data(client)
+    snapshot = {
+        'running': running,
+        'stopped': stopped,
+        'docker_info': docker_info.result(),
+        'networks': networks.result(),
+    }
+    return snapshot, datetime.now().strftime('%H:%M:%S')
+
+
+# ─── Background Stats Streams ────────────────────────────────────────────────
+
+def start_background_collectors(client):
+    """
+    An events watcher that keeps per-container caches in step with containers
+    starting and dying, plus one long-lived stats stream per running container.
+
+    Streaming means dockerd pushes a fresh sample every second over a single
+    connection, and the request handler just reads the latest one from memory.
+    The trade-off is constant (small) load on dockerd even when nobody is
+    looking at the dashboard.
+
+    Started lazily from the first request rather than at import time, so each
+    server worker process gets its own threads. The streams aren't needed
+    when the cgroup files are mounted — reading those is cheaper than any stream.
+    """
+    global _collectors_started
+    with _latest_stats_lock:
+        if _collectors_started:
+            return
+        _collectors_started = True
+
+    if _CGROUP_VERSION is None:
+        try:
+            for container in client.api.containers():
+                _start_stream(client, container['Id'])
+        except (docker.errors.DockerException, requests.exceptions.ConnectionError):
+            pass
+
+    threading.Thread(target=_watch_events, args=(client,), name='docker-events', daemon=True).start()
+
+
+def _start_stream(client, container_id):
+    token = object()
+    with _latest_stats_lock:
+        if container_id in _streams:
+            return
+        _streams[container_id] = token
+
+    threading.Thread(
+        target=_stream_stats,
+        args=(client, container_id, token),
+        name=f'stats-{container_id[:12]}',
+        daemon=True,
+    ).start()
+
+
+def _stop_stream(container_id):
+    with _latest_stats_lock:
+        _streams.pop(container_id, None)
+        _latest_stats.pop(container_id, None)
+
+
+def _stream_stats(client, container_id, token):
+    """
+    Keep _latest_stats[container_id] up to date until the container stops.
+    The token lets a stream notice it has been replaced — a container that
+    restarts quickly gets a new stream before the old one sees the stop.
+    """
+    try:
+        for sample in client.api.stats(container_id, decode=True, stream=True):
+            with _latest_stats_lock:
+                if _streams.get(container_id) is not token:
+                    return
+                # The very first sample has no precpu_stats to diff against
+                if sample.get('precpu_stats', {}).get('system_cpu_usage'):
+                    _latest_stats[container_id] = sample
+            mark_docker_ok()
+    except Exception:
+        pass
+    finally:
+        with _latest_stats_lock:
+            if _streams.get(container_id) is token:
+                del _streams[container_id]
+                _latest_stats.pop(container_id, None)
+
+
+def _watch_events(client):
+    """
+    Open and close stats streams as containers start and die, and forget
+    their cached StartedAt — a restart keeps the id but changes the time.
+    """
+    global _collectors_started, _started_at_generation
+    try:
+        events = client.events(decode=True, filters={'type': 'container', 'event': ['start', 'die']})
+        for event in events:
+            # Actor.ID — the top-level 'id' field is deprecated
+            container_id = event.get('Actor', {}).get('ID')
+            if not container_id:
+                continue
+            with _started_at_lock:
+                _started_at.pop(container_id, None)
+                _started_at_generation += 1
+            if event.get('Action') == 'start':
+                if _CGROUP_VERSION is None:
+                    _start_stream(client, container_id)
+            else:
+                _stop_stream(container_id)
+    except Exception:
+        pass
+    finally:
+        # Lost the event stream (daemon restart?) — the next request starts
+        # over, and anything cached in the meantime may be stale
+        with _started_at_lock:
+            _started_at.clear()
+            _started_at_generation += 1
+        with _latest_stats_lock:
+            _collectors_started = False
+
+
 # ─── Routes ──────────────────────────────────────────────────────────────────
 
 @app.route('/')
 def index():
+    """
+    The page shell only — the dashboard itself is rendered in the browser
+    from /api/state, which the page polls every REFRESH_INTERVAL seconds.
+    """
     client, error = get_docker_client()
 
     if error:
         return render_template('error.html', message=error)
 
-    running, stopped = get_container_data(client)
-    docker_info = get_docker_info(client)
-    networks = get_network_info(client)
-
-    return render_template('index.html',
-        running=running,
-        stopped=stopped,
-        docker_info=docker_info,
-        networks=networks,
-        last_updated=datetime.now().strftime('%H:%M:%S'),
-        refresh_interval=30
-    )
+    return render_template('index.html', refresh_interval=REFRESH_INTERVAL)
+
+
+@app.route('/api/state')
+def state():
+    """Everything the dashboard shows, as JSON."""
+    client, error = get_docker_client()
+    if error:
+        return jsonify({'status': 'error', 'message': error}), 500
+
+    start_background_collectors(client)
+    try:
+        snapshot, last_updated = get_snapshot(client)
+    except (docker.errors.DockerException, requests.exceptions.ConnectionError) as e:
+        # Nothing was cached — the next poll reconnects and tries again
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+    return jsonify({**snapshot, 'last_updated': last_updated})
+
+
+@app.route('/api/logs/<container_id>')
+def container_logs(container_id):
+    """
+    Last 20 log lines for one container.
+    Fetched by the page when a card is expanded, so the index render doesn't
+    pay a logs round-trip for every container.
+    """
+    client, error = get_docker_client()
+    if error:
+        return jsonify({'status': 'error', 'message': error}), 500
+
+    try:
+        logs = client.api.logs(container_id, tail=20, stream=False, timestamps=False)
+        mark_docker_ok()
+    except docker.errors.NotFound:
+        return jsonify({'status': 'error', 'message': 'container not found'}), 404
+    except (docker.errors.DockerException, requests.exceptions.ConnectionError) as e:
+        reset_docker_client()
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+    # splitlines handles \r\n and drops the trailing newline — no strip() pass
+    log_lines = logs.decode('utf-8', errors='replace').splitlines() if logs else []
+    return jsonify({'id': container_id, 'log_lines': log_lines})
 
 
 @app.route('/health')
@@ -244,10 +811,20 @@ def health():
     client, error = get_docker_client()
     if error:
         return jsonify({'status': 'error', 'message': error}), 500
+
+    # The client is cached, so check the daemon is still there
+    try:
+        ping_docker(client)
+    except (docker.errors.DockerException, requests.exceptions.ConnectionError) as e:
+        reset_docker_client()
+        return jsonify({'status': 'error', 'message': str(e)}), 500
     return jsonify({'status': 'ok', 'timestamp': datetime.now().isoformat()})
 
 
 # ─── Init ────────────────────────────────────────────────────────────────────
 
+# In the container the app is served by gunicorn (see Dockerfile) — all the
+# caches above live at module scope, so they persist across requests in its
+# single worker process. This entry point is for running locally.
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=False)